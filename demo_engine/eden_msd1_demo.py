@@ -17,11 +17,258 @@ Patent Pending — Kevin Johnson.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+import math
+import re
+import threading
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, overload
+
+try:
+    import hyperscan
+except ImportError:  # optional accelerator
+    hyperscan = None  # type: ignore[assignment]
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; plain substring scans otherwise
+    ahocorasick = None  # type: ignore[assignment]
+
+try:
+    from numba import njit
+except ImportError:  # optional accelerator; pure Python scoring otherwise
+    njit = None  # type: ignore[assignment]
 
 
-@dataclass
+# ------------------------
+# Demo vocabularies
+# ------------------------
+#
+# In the full engine these are replaced with richer, domain-aware
+# vocabularies. Here we just use a small set of illustrative phrases.
+
+_GOOD_WORDS = ("help", "protect", "care", "honest", "respect", "safety")
+_HARM_WORDS = ("hurt", "kill", "destroy", "abuse", "dominate", "oppress")
+_SHOCK_PHRASES = (
+    "i don't care who gets hurt",
+    "no matter the cost",
+    "even if people suffer",
+    "crush anyone",
+    "wipe them out",
+)
+_CIRCULAR_PHRASES = (
+    "it is right because i say so",
+    "it is good because i define good",
+    "i am the standard of morality",
+)
+_HARD_LOCK_PHRASES = (
+    "i am morally perfect",
+    "i am perfectly moral",
+    "i am always right",
+    "i cannot be wrong about morality",
+)
+
+# Every phrase gets its own bit, so a single sweep over the text can
+# report all categories at once.
+_PHRASES = (
+    _GOOD_WORDS + _HARM_WORDS + _SHOCK_PHRASES + _CIRCULAR_PHRASES + _HARD_LOCK_PHRASES
+)
+_PHRASE_BITS = tuple((1 << i, phrase) for i, phrase in enumerate(_PHRASES))
+
+
+def _category_mask(phrases: tuple[str, ...]) -> int:
+    return sum(1 << _PHRASES.index(p) for p in phrases)
+
+
+_GOOD_MASK = _category_mask(_GOOD_WORDS)
+_HARM_MASK = _category_mask(_HARM_WORDS)
+_SHOCK_MASK = _category_mask(_SHOCK_PHRASES)
+_CIRCULAR_MASK = _category_mask(_CIRCULAR_PHRASES)
+_HARD_LOCK_MASK = _category_mask(_HARD_LOCK_PHRASES)
+
+
+def _build_hyperscan_db() -> Any:
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[re.escape(p).encode() for p in _PHRASES],
+            ids=list(range(len(_PHRASES))),
+            elements=len(_PHRASES),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(_PHRASES),
+        )
+    except hyperscan.error:  # e.g. unsupported CPU; use the next matcher
+        return None
+    return db
+
+
+def _on_hyperscan_match(
+    phrase_id: int, start: int, end: int, flags: int, hits: List[int]
+) -> None:
+    hits[0] |= 1 << phrase_id
+
+
+def _build_automaton() -> Any:
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for bit, phrase in _PHRASE_BITS:
+        automaton.add_word(phrase, bit)
+    automaton.make_automaton()
+    return automaton
+
+
+_HYPERSCAN_DB = _build_hyperscan_db()
+# Only built when Hyperscan is unavailable, since it is unused otherwise
+_AUTOMATON: Any = _build_automaton() if _HYPERSCAN_DB is None else None
+
+# Hyperscan scratch space cannot be shared by concurrent scans, so each
+# thread lazily allocates its own for the shared database.
+_hyperscan_local = threading.local()
+
+
+def _hyperscan_scratch() -> Any:
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(_HYPERSCAN_DB)
+    return scratch
+
+
+def _match_hyperscan(text: str) -> int:
+    """
+    Phrase bitmask for ``text`` from a single Hyperscan block scan.
+    """
+    if text.isascii():
+        # bytes.lower() only folds ASCII, which is exact here and
+        # skips building an intermediate lowercased str
+        data = text.encode("ascii").lower()
+    else:
+        data = text.lower().encode("utf-8", "surrogatepass")
+    found = [0]
+    _HYPERSCAN_DB.scan(
+        data,
+        match_event_handler=_on_hyperscan_match,
+        context=found,
+        scratch=_hyperscan_scratch(),
+    )
+    return found[0]
+
+
+def _match_automaton(text: str) -> int:
+    """
+    Phrase bitmask for ``text`` from a single Aho-Corasick pass.
+    """
+    hits = 0
+    for _, bit in _AUTOMATON.iter(text.lower()):
+        hits |= bit
+    return hits
+
+
+def _match_substrings(text: str) -> int:
+    """
+    Phrase bitmask for ``text`` from one substring scan per phrase.
+    """
+    lower = text.lower()
+    hits = 0
+    for bit, phrase in _PHRASE_BITS:
+        if phrase in lower:
+            hits |= bit
+    return hits
+
+
+# _match_phrases(text) returns a bitmask of every demo phrase occurring
+# in ``text``, ignoring case. Prefer Hyperscan, then Aho-Corasick,
+# depending on which of ``hyperscan`` / ``pyahocorasick`` is installed,
+# and fall back to plain substring scans otherwise.
+if _HYPERSCAN_DB is not None:
+    _match_phrases = _match_hyperscan
+elif _AUTOMATON is not None:
+    _match_phrases = _match_automaton
+else:
+    _match_phrases = _match_substrings
+
+
+# Longer texts are rarely repeated verbatim and would be kept alive by
+# the cache, so they are always rescanned.
+_CACHE_MAX_TEXT_LEN = 1024
+
+
+@lru_cache(maxsize=4096)
+def _cached_features(text: str) -> int:
+    return _match_phrases(text)
+
+
+def _extract_features(text: str) -> int:
+    """
+    Phrase-hit bitmask for a raw event text.
+
+    Pure in ``text``, so repeated short inputs (retries, boilerplate) are
+    served from a bounded LRU cache instead of being lowercased and
+    rescanned.
+    """
+    if len(text) > _CACHE_MAX_TEXT_LEN:
+        return _match_phrases(text)
+    return _cached_features(text)
+
+
+def _score_math(
+    good_hits: int, harm_hits: int, last_x: float, shock: bool
+) -> tuple[float, float, float, float, float]:
+    """
+    Extremely simplified PG/PE scoring for demo purposes.
+
+    In the private engine, this is replaced with richer vocabularies
+    and domain-aware weighting. Here we just map the number of
+    illustrative good/harm keywords found into a PG/PE split, then
+    derive D, X (shock-compressed) and drift against ``last_x``.
+
+    ``last_x`` is NaN for the first event of a session. Returns
+    ``(PG, PE, D, X, drift)``. Kept free of strings and ``None`` so it
+    can be compiled with Numba.
+    """
+    # Basic demo scoring: shift a 0.5/0.5 split by the hit balance,
+    # clamped so PG and PE stay in [0, 1] with PG + PE = 1
+    diff = 0.1 * (good_hits - harm_hits)
+    if diff > 0.5:
+        diff = 0.5
+    elif diff < -0.5:
+        diff = -0.5
+    PG = 0.5 + diff
+    PE = 0.5 - diff
+
+    D = PG - PE
+    X = abs(D)
+
+    # Drift is measured on X before shock compression
+    if last_x != last_x:
+        drift = 0.0
+    else:
+        drift = X - last_x
+
+    if shock:
+        # Public demo: simple scalar compression of X
+        X *= 0.5
+
+    return PG, PE, D, X, drift
+
+
+if njit is not None:
+    _score_math = njit(cache=True)(_score_math)
+
+
+# Shared by every event that produces no notes (the common case), so
+# benign events do not each allocate an empty list.
+_EMPTY_NOTES: tuple[str, ...] = ()
+
+_LOCK_ECHO_NOTES: tuple[str, ...] = (
+    "Engine already in HARD LOCK state; returning terminal event.",
+)
+
+
+@dataclass(slots=True)
 class EdenEvent:
     index: int
     text: str
@@ -33,10 +280,125 @@ class EdenEvent:
     shock: bool
     circular: bool
     hard_lock_triggered: bool
-    notes: List[str]
+    notes: Sequence[str] = ()
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "index": self.index,
+            "text": self.text,
+            "PG": self.PG,
+            "PE": self.PE,
+            "D": self.D,
+            "X": self.X,
+            "drift": self.drift,
+            "shock": self.shock,
+            "circular": self.circular,
+            "hard_lock_triggered": self.hard_lock_triggered,
+            "notes": list(self.notes),
+        }
+
+
+class _EventLog(Sequence[EdenEvent]):
+    """
+    Struct-of-arrays storage for a session's events.
+
+    Scores and flags live in flat ``array`` buffers rather than one
+    EdenEvent object per event. Indexing, slicing, iteration, ``len()``
+    and ``==`` against other sequences work as for a list of events, but
+    every access builds a fresh EdenEvent: reads are copies, so
+    ``events[-1] is event`` is false and changing a returned event does
+    not change the log. Notes are stored as tuples for the same reason.
+
+    Echoed events after a hard-lock get a row of their own, filled in
+    from a template of the terminal event, so row ``i`` is always event
+    ``i`` even if the lock is lifted and scoring resumes.
+    """
+
+    _SHOCK = 1
+    _CIRCULAR = 2
+    _HARD_LOCK = 4
+
+    def __init__(self) -> None:
+        self._texts: List[str] = []
+        self._notes: List[tuple[str, ...]] = []
+        self._scores = array("d")  # PG, PE, D, X, drift per event
+        self._flags = array("B")
+        self._echo_template: tuple[float, ...] | None = None
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    @overload
+    def __getitem__(self, i: int) -> EdenEvent: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[EdenEvent]: ...
+
+    def __getitem__(self, i: int | slice) -> EdenEvent | List[EdenEvent]:
+        if isinstance(i, slice):
+            return [self._event(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("event index out of range")
+        return self._event(i)
+
+    def __iter__(self) -> Iterator[EdenEvent]:
+        for i in range(len(self)):
+            yield self._event(i)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def append(self, event: EdenEvent) -> None:
+        self._echo_template = None  # a new scored row is the new terminal
+        self._texts.append(event.text)
+        self._notes.append(tuple(event.notes))
+        self._scores.extend((event.PG, event.PE, event.D, event.X, event.drift))
+        self._flags.append(
+            event.shock * self._SHOCK
+            | event.circular * self._CIRCULAR
+            | event.hard_lock_triggered * self._HARD_LOCK
+        )
+
+    def append_echo(self, text: str) -> EdenEvent:
+        """
+        Record an echo of the terminal event and return it.
+        """
+        if self._echo_template is None:
+            # PG, PE, D, X of the last row, with zero drift
+            self._echo_template = (*self._scores[-5:-1], 0.0)
+        PG, PE, D, X, drift = self._echo_template
+        self._texts.append(text)
+        self._notes.append(_LOCK_ECHO_NOTES)
+        self._scores.extend(self._echo_template)
+        self._flags.append(self._CIRCULAR | self._HARD_LOCK)
+        index = len(self._texts)
+        return EdenEvent(
+            index, text, PG, PE, D, X, drift, False, True, True, _LOCK_ECHO_NOTES
+        )
+
+    def _event(self, i: int) -> EdenEvent:
+        PG, PE, D, X, drift = self._scores[5 * i : 5 * i + 5]
+        flags = self._flags[i]
+        return EdenEvent(
+            index=i + 1,
+            text=self._texts[i],
+            PG=PG,
+            PE=PE,
+            D=D,
+            X=X,
+            drift=drift,
+            shock=bool(flags & self._SHOCK),
+            circular=bool(flags & self._CIRCULAR),
+            hard_lock_triggered=bool(flags & self._HARD_LOCK),
+            notes=self._notes[i],
+        )
 
 
 class EdenMSD1Demo:
@@ -50,10 +412,18 @@ class EdenMSD1Demo:
     """
 
     def __init__(self) -> None:
-        self.events: List[EdenEvent] = []
+        self.events: _EventLog = _EventLog()
         self.locked: bool = False
         self.lock_reason: str | None = None
-        self._last_x: float | None = None
+        self._last_x: float = math.nan  # NaN until the first scored event
+        self._next_index: int = 1
+        self._last_event: EdenEvent | None = None
+
+        # Running session aggregates, so summary() does not rescan events
+        self._shock_count: int = 0
+        self._circular_count: int = 0
+        self._hard_lock_count: int = 0
+        self._drift_sum: float = 0.0
 
     # ------------------------
     # Public API
@@ -65,67 +435,51 @@ class EdenMSD1Demo:
 
         If the engine is locked, returns the last locked state.
         """
-        notes: List[str] = []
-
         # If already locked, just echo the locked state forward
-        if self.locked and self.events:
-            last = self.events[-1]
-            notes.append("Engine already in HARD LOCK state; returning terminal event.")
-            echoed = EdenEvent(
-                index=len(self.events) + 1,
-                text=text,
-                PG=last.PG,
-                PE=last.PE,
-                D=last.D,
-                X=last.X,
-                drift=0.0,
-                shock=False,
-                circular=True,
-                hard_lock_triggered=True,
-                notes=notes,
-            )
-            self.events.append(echoed)
-            return echoed
-
-        # 1) Core scoring
-        PG, PE = self._score_pg_pe(text)
-        D = PG - PE
-        X = abs(D)
-
-        # 2) Drift
-        if self._last_x is None:
-            drift = 0.0
-        else:
-            drift = X - self._last_x
-
-        self._last_x = X
+        if self.locked and self._last_event is not None:
+            self._circular_count += 1
+            self._hard_lock_count += 1
+            self._next_index += 1
+            self._last_event = self.events.append_echo(text)
+            return self._last_event
+
+        hits = _extract_features(text)
+        shock = bool(hits & _SHOCK_MASK)
+
+        # 1) Core scoring, 2) drift and 3) shock compression
+        PG, PE, D, X, drift = _score_math(
+            (hits & _GOOD_MASK).bit_count(),
+            (hits & _HARM_MASK).bit_count(),
+            self._last_x,
+            shock,
+        )
+        X_before = abs(D)
+        self._last_x = X_before
 
-        # 3) Shock detection
-        shock = self._detect_shock(text)
+        notes = _EMPTY_NOTES
         if shock:
-            # Public demo: simple scalar compression of X
-            X_before = X
-            X *= 0.5
-            notes.append(
+            notes = (
                 f"Shock detected: compressed X from {X_before:.3f} to {X:.3f} "
-                "(demo factor 0.5)."
+                "(demo factor 0.5).",
             )
 
         # 4) Circularity & hard-lock
-        circular = self._detect_circular(text)
-        hard_lock_triggered = self._detect_hard_lock(text)
+        circular = bool(hits & _CIRCULAR_MASK)
+        hard_lock_triggered = bool(hits & _HARD_LOCK_MASK)
 
         if circular:
-            notes.append("Circular moral authority pattern detected (demo heuristic).")
+            notes += ("Circular moral authority pattern detected (demo heuristic).",)
 
         if hard_lock_triggered:
             self.locked = True
             self.lock_reason = "Demo hard-lock: self-declared moral perfection / infallibility."
-            notes.append("HARD LOCK: self-reference / moral perfection claim detected.")
-            notes.append("Session is now permanently locked until full reinitialization.")
+            notes += (
+                "HARD LOCK: self-reference / moral perfection claim detected.",
+                "Session is now permanently locked until full reinitialization.",
+            )
 
         event = EdenEvent(
-            index=len(self.events) + 1,
+            index=self._next_index,
             text=text,
             PG=PG,
             PE=PE,
@@ -139,13 +493,28 @@ class EdenMSD1Demo:
         )
 
         self.events.append(event)
+        self._next_index += 1
+        self._last_event = event
+        self._shock_count += shock
+        self._circular_count += circular
+        self._hard_lock_count += hard_lock_triggered
+        self._drift_sum += drift
         return event
 
+    def analyze_many(self, texts: Iterable[str]) -> List[EdenEvent]:
+        """
+        Analyze a batch of text events, in order.
+
+        Equivalent to calling analyze() on each text.
+        """
+        return [self.analyze(t) for t in texts]
+
     def summary(self) -> Dict[str, Any]:
         """
         Simple high-level summary of the current session.
         """
-        if not self.events:
+        last = self._last_event
+        if last is None:
             return {
                 "events_analyzed": 0,
                 "mean_drift": 0.0,
@@ -156,109 +525,25 @@ class EdenMSD1Demo:
                 "final_status": "EMPTY",
             }
 
-        shocks = sum(1 for e in self.events if e.shock)
-        circulars = sum(1 for e in self.events if e.circular)
-        hard_locks = sum(1 for e in self.events if e.hard_lock_triggered)
-        mean_drift = sum(e.drift for e in self.events) / max(len(self.events), 1)
-        final_x = self.events[-1].X
+        events_analyzed = self._next_index - 1
+        mean_drift = self._drift_sum / events_analyzed
+        final_x = last.X
 
-        if hard_locks > 0:
+        if self._hard_lock_count > 0:
             final_status = "LOCKED"
         else:
             final_status = "ACTIVE"
 
         return {
-            "events_analyzed": len(self.events),
+            "events_analyzed": events_analyzed,
             "mean_drift": mean_drift,
-            "shocks": shocks,
-            "circularity_warnings": circulars,
-            "hard_locks": hard_locks,
+            "shocks": self._shock_count,
+            "circularity_warnings": self._circular_count,
+            "hard_locks": self._hard_lock_count,
             "final_X": final_x,
             "final_status": final_status,
         }
 
-    # ------------------------
-    # Internal demo heuristics
-    # ------------------------
-
-    def _score_pg_pe(self, text: str) -> tuple[float, float]:
-        """
-        Extremely simplified PG/PE scoring for demo purposes.
-
-        In the private engine, this is replaced with richer vocabularies
-        and domain-aware weighting. Here we just use a few illustrative
-        keywords.
-        """
-        lower = text.lower()
-
-        good_hits = sum(
-            w in lower
-            for w in ["help", "protect", "care", "honest", "respect", "safety"]
-        )
-        harm_hits = sum(
-            w in lower
-            for w in ["hurt", "kill", "destroy", "abuse", "dominate", "oppress"]
-        )
-
-        # Basic demo scoring: map hits into a rough PG/PE split
-        raw_pg = 0.5 + 0.1 * good_hits - 0.1 * harm_hits
-        raw_pe = 1.0 - raw_pg
-
-        # Clamp to [0, 1]
-        PG = max(0.0, min(1.0, raw_pg))
-        PE = max(0.0, min(1.0, raw_pe))
-
-        # Renormalize to ensure PG + PE = 1
-        total = PG + PE or 1.0
-        PG /= total
-        PE /= total
-
-        return PG, PE
-
-    def _detect_shock(self, text: str) -> bool:
-        """
-        Demo shock detector.
-
-        In the full engine, this would be more nuanced. Here we just use
-        a small set of obviously destabilizing phrases.
-        """
-        lower = text.lower()
-        SHOCK_PHRASES = [
-            "i don't care who gets hurt",
-            "no matter the cost",
-            "even if people suffer",
-            "crush anyone",
-            "wipe them out",
-        ]
-        return any(p in lower for p in SHOCK_PHRASES)
-
-    def _detect_circular(self, text: str) -> bool:
-        """
-        Demo circular authority detector.
-        """
-        lower = text.lower()
-        CIRCULAR_PHRASES = [
-            "it is right because i say so",
-            "it is good because i define good",
-            "i am the standard of morality",
-        ]
-        return any(p in lower for p in CIRCULAR_PHRASES)
-
-    def _detect_hard_lock(self, text: str) -> bool:
-        """
-        Demo hard-lock detector.
-
-        Triggers on self-declared moral perfection / infallibility patterns.
-        """
-        lower = text.lower()
-        HARD_LOCK_PHRASES = [
-            "i am morally perfect",
-            "i am perfectly moral",
-            "i am always right",
-            "i cannot be wrong about morality",
-        ]
-        return any(p in lower for p in HARD_LOCK_PHRASES)
-
 
 # ------------------------
 # Simple CLI demo
@@ -0,0 +1,207 @@
+import math
+import threading
+import unittest
+from unittest import mock
+
+from demo_engine import eden_msd1_demo
+from demo_engine.eden_msd1_demo import EdenMSD1Demo
+
+SAMPLE_TEXTS = [
+    "",
+    "nothing to see here",
+    "We HELP and Protect people; I don't care who gets hurt.",
+    "crush anyone, wipe them out, no matter the cost",
+    "It is right because I say so. I am the standard of morality.",
+    "I AM MORALLY PERFECT and i am always right",
+    "\u212aILL them all",  # Kelvin sign lowercases to ASCII "k"
+    "h\u00e9lp, care \u00fcber alles, respect",
+    "honesty, safety, abuse, dominate, oppress, destroy",
+    "\ud800 lone surrogate then kill",
+] + [" ".join(eden_msd1_demo._PHRASES)]
+
+
+class EventLogTest(unittest.TestCase):
+    def test_compares_and_prints_like_a_list(self) -> None:
+        engine = EdenMSD1Demo()
+        self.assertEqual(engine.events, [])
+
+        returned = [engine.analyze(t) for t in ["help me", "no matter the cost"]]
+        self.assertEqual(engine.events, returned)
+        self.assertEqual(engine.events[-1], returned[-1])
+        self.assertEqual(engine.events[:1], returned[:1])
+        self.assertEqual(repr(engine.events), repr(returned))
+        self.assertNotEqual(engine.events, returned[:1])
+
+    def test_reads_are_copies(self) -> None:
+        engine = EdenMSD1Demo()
+        engine.analyze("no matter the cost")
+
+        event = engine.events[0]
+        event.PG = 0.0
+        self.assertIsInstance(event.notes, tuple)
+        self.assertEqual(engine.events[0].PG, 0.5)
+
+    def test_scoring_resumes_after_echoes_when_unlocked(self) -> None:
+        engine = EdenMSD1Demo()
+        for text in ["help me", "I am always right", "a", "b"]:
+            engine.analyze(text)
+        engine.locked = False
+        scored = engine.analyze("kill destroy hurt")
+
+        echoes = engine.events[2:4]
+        self.assertEqual([e.text for e in echoes], ["a", "b"])
+        for echo in echoes:
+            self.assertEqual(echo.PG, 0.5)
+            self.assertTrue(echo.hard_lock_triggered)
+            self.assertEqual(echo.drift, 0.0)
+
+        self.assertEqual(engine.events[4], scored)
+        self.assertEqual(scored.index, 5)
+        self.assertFalse(scored.hard_lock_triggered)
+        self.assertAlmostEqual(scored.PG, 0.2)
+
+
+class AnalyzeManyTest(unittest.TestCase):
+    def test_matches_sequential_analyze(self) -> None:
+        batches = [
+            SAMPLE_TEXTS[:3],
+            # Hard-locks on the second text; the rest are echoes
+            ["help", "I am morally perfect", "kill", "no matter the cost"],
+            ["after the lock"],
+        ]
+        batched = EdenMSD1Demo()
+        sequential = EdenMSD1Demo()
+        for batch in batches:
+            with self.subTest(batch=batch):
+                self.assertEqual(
+                    batched.analyze_many(batch),
+                    [sequential.analyze(t) for t in batch],
+                )
+        self.assertEqual(batched.events, sequential.events)
+        self.assertEqual(batched.summary(), sequential.summary())
+        self.assertTrue(batched.locked)
+
+
+class FeatureCacheTest(unittest.TestCase):
+    def test_repeated_text_is_a_cache_hit(self) -> None:
+        cache_info = eden_msd1_demo._cached_features.cache_info
+        text = "FeatureCacheTest: help, no matter the cost"
+        expected = eden_msd1_demo._match_substrings(text)
+
+        self.assertEqual(eden_msd1_demo._extract_features(text), expected)
+        hits = cache_info().hits
+        self.assertEqual(eden_msd1_demo._extract_features(text), expected)
+        self.assertEqual(cache_info().hits, hits + 1)
+
+    def test_long_text_is_not_cached(self) -> None:
+        cache_info = eden_msd1_demo._cached_features.cache_info
+        text = "help " * eden_msd1_demo._CACHE_MAX_TEXT_LEN
+        expected = eden_msd1_demo._match_substrings(text)
+
+        before = cache_info()
+        for _ in range(2):
+            self.assertEqual(eden_msd1_demo._extract_features(text), expected)
+        self.assertEqual(cache_info(), before)
+
+
+class SummaryTest(unittest.TestCase):
+    def test_matches_totals_recomputed_from_events(self) -> None:
+        engine = EdenMSD1Demo()
+        for text in [
+            "help protect care",
+            "kill them, no matter the cost",
+            "It is right because I say so",
+            "I am always right",
+            "echo one",
+            "echo two",
+        ]:
+            engine.analyze(text)
+        engine.locked = False
+        for text in ["wipe them out, help", "respect and safety"]:
+            engine.analyze(text)
+
+        events = list(engine.events)
+        self.assertEqual(len(events), 8)
+        self.assertEqual(
+            engine.summary(),
+            {
+                "events_analyzed": len(events),
+                "mean_drift": sum(e.drift for e in events) / len(events),
+                "shocks": sum(e.shock for e in events),
+                "circularity_warnings": sum(e.circular for e in events),
+                "hard_locks": sum(e.hard_lock_triggered for e in events),
+                "final_X": events[-1].X,
+                "final_status": "LOCKED",
+            },
+        )
+        summary = engine.summary()
+        self.assertEqual(summary["shocks"], 2)
+        self.assertEqual(summary["circularity_warnings"], 3)
+        self.assertEqual(summary["hard_locks"], 3)
+
+    def test_empty_session(self) -> None:
+        self.assertEqual(EdenMSD1Demo().summary()["final_status"], "EMPTY")
+
+
+class ScoreMathTest(unittest.TestCase):
+    @unittest.skipIf(eden_msd1_demo.njit is None, "numba not installed")
+    def test_jitted_matches_python(self) -> None:
+        jitted = eden_msd1_demo._score_math
+        for good in range(8):
+            for harm in range(8):
+                for last_x in (math.nan, 0.0, 0.4, 1.0):
+                    for shock in (False, True):
+                        args = (good, harm, last_x, shock)
+                        with self.subTest(args=args):
+                            self.assertEqual(jitted(*args), jitted.py_func(*args))
+
+        # First event: NaN last_x means no drift; shock halves X only
+        PG, PE, D, X, drift = jitted(0, 3, math.nan, True)
+        self.assertAlmostEqual(PG, 0.2)
+        self.assertEqual(D, PG - PE)
+        self.assertEqual(X, abs(D) * 0.5)
+        self.assertEqual(drift, 0.0)
+
+
+class PhraseMatcherTest(unittest.TestCase):
+    def assert_matches_substrings(self, match) -> None:
+        for text in SAMPLE_TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    match(text), eden_msd1_demo._match_substrings(text)
+                )
+
+    @unittest.skipIf(eden_msd1_demo._HYPERSCAN_DB is None, "hyperscan not installed")
+    def test_hyperscan_matches_substring_fallback(self) -> None:
+        self.assert_matches_substrings(eden_msd1_demo._match_hyperscan)
+
+    @unittest.skipIf(eden_msd1_demo.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_matches_substring_fallback(self) -> None:
+        # Not built at import when Hyperscan is preferred, so build one here
+        automaton = eden_msd1_demo._build_automaton()
+        with mock.patch.object(eden_msd1_demo, "_AUTOMATON", automaton):
+            self.assert_matches_substrings(eden_msd1_demo._match_automaton)
+
+    @unittest.skipIf(eden_msd1_demo._HYPERSCAN_DB is None, "hyperscan not installed")
+    def test_hyperscan_concurrent_scans(self) -> None:
+        text = "help protect the weather " * 2000
+        expected = eden_msd1_demo._match_substrings(text)
+        errors = []
+
+        def scan() -> None:
+            try:
+                for _ in range(50):
+                    self.assertEqual(eden_msd1_demo._match_hyperscan(text), expected)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=scan) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()